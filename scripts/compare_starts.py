@@ -27,8 +27,17 @@ class TxtEntry:
 
 def read_csv_starts(path: Path) -> List[int]:
     with path.open(newline="") as handle:
-        reader = csv.DictReader(handle)
-        return [int(row["start"]) for row in reader]
+        header_line = handle.readline()
+        if not header_line:
+            return []
+        start_col = next(csv.reader([header_line])).index("start")
+        # Columns up to and including `start` are unquoted integers in the Rust
+        # CSV, so the field is exactly the text between the surrounding commas.
+        return [
+            int(line.split(",", start_col + 1)[start_col])
+            for line in handle
+            if not line.isspace()
+        ]
 
 
 def read_txt_entries(path: Path) -> List[TxtEntry]:
@@ -54,12 +63,14 @@ def read_txt_entries(path: Path) -> List[TxtEntry]:
     return entries
 
 
-def format_neighbor(entries: List[TxtEntry], csv: List[int], idx: int) -> str:
-    if idx < 0 or idx >= len(entries) or idx >= len(csv):
+def format_neighbor(
+    entries: List[TxtEntry], csv: List[int], matches: List[bool], idx: int
+) -> str:
+    if idx < 0 or idx >= len(matches):
         return "<no neighbor>"
     txt = entries[idx]
     csv_start = csv[idx]
-    status = "match" if txt.start1 == csv_start else "DIFF"
+    status = "match" if matches[idx] else "DIFF"
     return f"row {txt.row_num}: txt={txt.start1} csv={csv_start} ({status})"
 
 
@@ -78,10 +89,11 @@ def main() -> None:
     csv_starts = read_csv_starts(args.csv)
     txt_entries = read_txt_entries(args.txt)
 
-    min_len = min(len(csv_starts), len(txt_entries))
+    # Compare the shared prefix once; neighbor reporting reuses these flags.
+    matches = [txt.start1 == start for txt, start in zip(txt_entries, csv_starts)]
     mismatches = []
-    for idx in range(min_len):
-        if txt_entries[idx].start1 != csv_starts[idx]:
+    for idx, matched in enumerate(matches):
+        if not matched:
             mismatches.append(idx)
 
     print(f"CSV rows: {len(csv_starts)}")
@@ -100,8 +112,8 @@ def main() -> None:
             f"Mismatch #{offset + 1} (row {txt.row_num}): txt start1={txt.start1}, csv start={csv_start}"
         )
         print(f"  raw TXT line: {txt.raw_line}")
-        prev_info = format_neighbor(txt_entries, csv_starts, idx - 1)
-        next_info = format_neighbor(txt_entries, csv_starts, idx + 1)
+        prev_info = format_neighbor(txt_entries, csv_starts, matches, idx - 1)
+        next_info = format_neighbor(txt_entries, csv_starts, matches, idx + 1)
         print(f"  prev -> {prev_info}")
         print(f"  next -> {next_info}")
 
@@ -8,9 +8,22 @@ import csv
 import gzip
 import json
 import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from typing import (
+    Container,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+)
 from urllib.parse import unquote
 
 
@@ -61,28 +74,29 @@ class RegionRow:
     length_match: str = ""
     status: str = "missing_in_fna"
 
-    def as_csv_row(self) -> Dict[str, str]:
-        return {
-            "assembly_id": self.assembly_id,
-            "seqid": self.seqid,
-            "region_start": str(self.region_start),
-            "region_end": str(self.region_end),
-            "region_length": str(self.region_length),
-            "source": self.source,
-            "strand": self.strand,
-            "genome": self.genome,
-            "mol_type": self.mol_type,
-            "is_circular": self.is_circular,
-            "name": self.name,
-            "strain": self.strain,
-            "plasmid_name": self.plasmid_name,
-            "taxon_id": self.taxon_id,
-            "fna_header": self.fna_header,
-            "fna_length": "" if self.fna_length is None else str(self.fna_length),
-            "length_match": self.length_match,
-            "status": self.status,
-            "attributes_json": self.attributes_json,
-        }
+    def as_csv_values(self) -> List[str]:
+        # Same order as CSV_FIELDS.
+        return [
+            self.assembly_id,
+            self.seqid,
+            str(self.region_start),
+            str(self.region_end),
+            str(self.region_length),
+            self.source,
+            self.strand,
+            self.genome,
+            self.mol_type,
+            self.is_circular,
+            self.name,
+            self.strain,
+            self.plasmid_name,
+            self.taxon_id,
+            self.fna_header,
+            "" if self.fna_length is None else str(self.fna_length),
+            self.length_match,
+            self.status,
+            self.attributes_json,
+        ]
 
 
 def info(message: str) -> None:
@@ -104,11 +118,8 @@ def parse_attributes(raw: str) -> Dict[str, str]:
     for part in raw.split(";"):
         if not part:
             continue
-        if "=" in part:
-            key, value = part.split("=", 1)
-            attrs[key] = unquote(value)
-        else:
-            attrs[part] = ""
+        key, sep, value = part.partition("=")
+        attrs[key] = unquote(value) if sep else ""
     return attrs
 
 
@@ -143,18 +154,22 @@ def parse_gff_regions(gff_path: Path, assembly_id: str) -> List[RegionRow]:
             if not line:
                 continue
 
-            if line.startswith("##sequence-region "):
-                parsed = parse_sequence_region(line)
-                if parsed is None:
-                    warn(
-                        f"{assembly_id}: malformed ##sequence-region at {gff_path.name}:{line_no}"
-                    )
-                else:
-                    seqid, length = parsed
-                    seq_region_lengths[seqid] = length
+            if line[0] == "#":
+                if line.startswith("##sequence-region "):
+                    parsed = parse_sequence_region(line)
+                    if parsed is None:
+                        warn(
+                            f"{assembly_id}: malformed ##sequence-region at {gff_path.name}:{line_no}"
+                        )
+                    else:
+                        seqid, length = parsed
+                        seq_region_lengths[seqid] = length
                 continue
 
-            if line.startswith("#"):
+            # A well-formed row has exactly 8 tabs, and a region row must contain
+            # "\tregion\t"; rows failing either check fall through to the split
+            # below so malformed rows are still reported.
+            if "\tregion\t" not in line and line.count("\t") == 8:
                 continue
 
             cols = line.split("\t")
@@ -207,9 +222,14 @@ def parse_gff_regions(gff_path: Path, assembly_id: str) -> List[RegionRow]:
     return rows
 
 
-def iter_fasta_records(fna_path: Path) -> Iterator[Tuple[str, str, List[str], int]]:
+def iter_fasta_records(
+    fna_path: Path, wanted: Container[str]
+) -> Iterator[Tuple[str, str, List[str], int]]:
+    # Only records whose seqid is in `wanted` are buffered and yielded, so at
+    # most one wanted record's lines are held in memory at a time.
     header = ""
     seqid = ""
+    keep = False
     seq_lines: List[str] = []
     seq_len = 0
 
@@ -220,72 +240,97 @@ def iter_fasta_records(fna_path: Path) -> Iterator[Tuple[str, str, List[str], in
                 continue
 
             if line.startswith(">"):
-                if header:
+                if keep:
                     yield seqid, header, seq_lines, seq_len
                 header = line[1:].strip()
                 seqid = header.split()[0] if header else ""
+                keep = bool(header) and seqid in wanted
                 seq_lines = []
                 seq_len = 0
                 continue
 
-            seq_lines.append(line)
-            seq_len += len(line.strip())
+            if keep:
+                seq_lines.append(line)
+                seq_len += len(line.strip())
 
-    if header:
+    if keep:
         yield seqid, header, seq_lines, seq_len
 
 
+FASTA_WRITE_BUFFER = 1 << 20
+
+
 def write_fasta(path: Path, header: str, seq_lines: Iterable[str]) -> None:
-    with path.open("w", encoding="utf-8", newline="\n") as handle:
+    with path.open(
+        "w", encoding="utf-8", newline="\n", buffering=FASTA_WRITE_BUFFER
+    ) as handle:
         handle.write(f">{header}\n")
-        for line in seq_lines:
-            handle.write(f"{line}\n")
+        handle.writelines(f"{line}\n" for line in seq_lines)
 
 
 def write_regions_csv(path: Path, rows: List[RegionRow]) -> None:
     with path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=CSV_FIELDS)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row.as_csv_row())
+        writer = csv.writer(handle)
+        writer.writerow(CSV_FIELDS)
+        writer.writerows(row.as_csv_values() for row in rows)
 
 
-def append_summary_rows(writer: csv.DictWriter, rows: List[RegionRow]) -> None:
-    for row in rows:
-        writer.writerow(row.as_csv_row())
+# The part of the `csv.writer` interface used for the summary CSV.
+class RowWriter(Protocol):
+    def writerows(self, rows: Iterable[Iterable[str]]) -> None: ...
+
+
+def append_summary_rows(writer: RowWriter, rows: List[RegionRow]) -> None:
+    writer.writerows(row.as_csv_values() for row in rows)
+
 
+ASSEMBLY_FILE_SUFFIXES = {
+    "_genomic.gff": "gff",
+    "_genomic.gff.gz": "gff",
+    "_genomic.fna": "fna",
+    "_genomic.fna.gz": "fna",
+}
 
-def collect_matches(assembly_dir: Path, pattern: str) -> List[Path]:
-    return sorted(assembly_dir.glob(pattern))
 
+def index_assembly_files(assembly_dir: Path) -> Dict[str, List[Path]]:
+    # No name can end with more than one of the suffixes, so each file lands in
+    # at most one bucket; each bucket is sorted like a glob result.
+    index: Dict[str, List[Path]] = {"gff": [], "fna": []}
+    for path in assembly_dir.iterdir():
+        name = path.name
+        for suffix, kind in ASSEMBLY_FILE_SUFFIXES.items():
+            if name.endswith(suffix):
+                index[kind].append(path)
+                break
+    for paths in index.values():
+        paths.sort()
+    return index
 
-def find_single_assembly_file(assembly_dir: Path, suffix: str) -> Optional[Path]:
-    matches = collect_matches(assembly_dir, f"*_genomic.{suffix}")
-    matches.extend(collect_matches(assembly_dir, f"*_genomic.{suffix}.gz"))
-    matches = sorted(matches)
+
+def find_single_assembly_file(index: Dict[str, List[Path]], kind: str) -> Optional[Path]:
+    matches = index.get(kind, [])
     if len(matches) == 1:
         return matches[0]
     return None
 
 
+# Summary rows (None when the assembly is skipped) and the mismatch count.
+AssemblyResult = Tuple[Optional[List[RegionRow]], int]
+
+
 def process_assembly(
     assembly_dir: Path,
     output_root: Path,
-) -> Tuple[Optional[List[RegionRow]], int]:
+) -> AssemblyResult:
     assembly_id = assembly_dir.name
-    gff_path = find_single_assembly_file(assembly_dir, "gff")
-    fna_path = find_single_assembly_file(assembly_dir, "fna")
+    files = index_assembly_files(assembly_dir)
+    gff_path = find_single_assembly_file(files, "gff")
+    fna_path = find_single_assembly_file(files, "fna")
 
     if gff_path is None or fna_path is None:
-        gff_candidates = collect_matches(assembly_dir, "*_genomic.gff") + collect_matches(
-            assembly_dir, "*_genomic.gff.gz"
-        )
-        fna_candidates = collect_matches(assembly_dir, "*_genomic.fna") + collect_matches(
-            assembly_dir, "*_genomic.fna.gz"
-        )
         warn(
             f"{assembly_id}: skipped (expect exactly one *_genomic.gff(.gz) and "
-            f"one *_genomic.fna(.gz), got gff={len(gff_candidates)}, fna={len(fna_candidates)})"
+            f"one *_genomic.fna(.gz), got gff={len(files['gff'])}, fna={len(files['fna'])})"
         )
         return None, 0
 
@@ -300,7 +345,7 @@ def process_assembly(
 
     seen_seqids: set[str] = set()
     written_split_files = 0
-    for seqid, header, seq_lines, seq_len in iter_fasta_records(fna_path):
+    for seqid, header, seq_lines, seq_len in iter_fasta_records(fna_path, by_seqid):
         target_rows = by_seqid.get(seqid)
         if not target_rows:
             continue
@@ -323,15 +368,16 @@ def process_assembly(
             write_fasta(split_dir / f"{seqid}.fna", header, seq_lines)
             written_split_files += 1
 
-    mismatch_count = 0
-    warned: set[Tuple[str, str]] = set()
-    for row in rows:
-        if row.seqid not in seen_seqids:
+    for seqid in by_seqid.keys() - seen_seqids:
+        for row in by_seqid[seqid]:
             row.status = "missing_in_fna"
             row.fna_header = ""
             row.fna_length = None
             row.length_match = ""
 
+    mismatch_count = 0
+    warned: set[Tuple[str, str]] = set()
+    for row in rows:
         if row.status in MISMATCH_STATUSES:
             mismatch_count += 1
             key = (row.seqid, row.status)
@@ -362,6 +408,35 @@ def discover_assembly_dirs(input_root: Path) -> List[Path]:
     return [input_root]
 
 
+def iter_assembly_results(
+    assembly_dirs: List[Path],
+    output_root: Path,
+    workers: int,
+) -> Iterator[Tuple[Path, AssemblyResult]]:
+    if workers == 1:
+        for assembly_dir in assembly_dirs:
+            yield assembly_dir, process_assembly(assembly_dir, output_root)
+        return
+
+    # At most `workers` assemblies are in flight, and results are yielded in
+    # input order. The next assembly is submitted only after the caller has
+    # consumed a result, so stopping iteration submits no further work.
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending_dirs = iter(assembly_dirs)
+        in_flight: Deque[Tuple[Path, Future]] = deque(
+            (assembly_dir, executor.submit(process_assembly, assembly_dir, output_root))
+            for assembly_dir in islice(pending_dirs, workers)
+        )
+        while in_flight:
+            assembly_dir, future = in_flight.popleft()
+            yield assembly_dir, future.result()
+            next_dir = next(pending_dirs, None)
+            if next_dir is not None:
+                in_flight.append(
+                    (next_dir, executor.submit(process_assembly, next_dir, output_root))
+                )
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -387,6 +462,15 @@ def parse_args() -> argparse.Namespace:
         default="regions.all.csv",
         help="Filename for summary CSV under output-root (default: regions.all.csv).",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of assemblies processed in parallel (default: 1). "
+            "Log lines from concurrently processed assemblies may interleave."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -399,6 +483,10 @@ def main() -> int:
         print(f"[ERROR] input-root is not a directory: {input_root}", file=sys.stderr)
         return 2
 
+    if args.jobs < 1:
+        print(f"[ERROR] --jobs must be >= 1, got {args.jobs}", file=sys.stderr)
+        return 2
+
     output_root.mkdir(parents=True, exist_ok=True)
 
     assembly_dirs = discover_assembly_dirs(input_root)
@@ -412,12 +500,14 @@ def main() -> int:
     total_rows = 0
     total_mismatches = 0
 
+    workers = min(args.jobs, len(assembly_dirs))
     with summary_path.open("w", encoding="utf-8", newline="") as summary_handle:
-        summary_writer = csv.DictWriter(summary_handle, fieldnames=CSV_FIELDS)
-        summary_writer.writeheader()
+        summary_writer = csv.writer(summary_handle)
+        summary_writer.writerow(CSV_FIELDS)
 
-        for assembly_dir in assembly_dirs:
-            rows, mismatch_count = process_assembly(assembly_dir, output_root)
+        for assembly_dir, (rows, mismatch_count) in iter_assembly_results(
+            assembly_dirs, output_root, workers
+        ):
             if rows is None:
                 skipped_assemblies += 1
                 continue
@@ -1,7 +1,10 @@
-use std::collections::HashSet;
+use std::collections::{HashMap, HashSet};
 use std::fs;
+use std::io::{self, Write};
 use std::path::{Path, PathBuf};
 
+use rayon::prelude::*;
+
 #[derive(Debug, Clone, PartialEq)]
 struct G4Record {
     start: u32,
@@ -15,7 +18,10 @@ struct G4Record {
     sequence: String,
 }
 
-fn parse_csv_file(path: &Path) -> Result<Vec<G4Record>, Box<dyn std::error::Error>> {
+fn parse_csv_file(
+    path: &Path,
+    warnings: &mut Vec<String>,
+) -> Result<Vec<G4Record>, Box<dyn std::error::Error>> {
     let content = fs::read_to_string(path)?;
     let mut records = Vec::new();
 
@@ -27,7 +33,12 @@ fn parse_csv_file(path: &Path) -> Result<Vec<G4Record>, Box<dyn std::error::Erro
 
         let parts: Vec<&str> = line.split(',').collect();
         if parts.len() != 9 {
-            eprintln!("⚠️  跳过格式错误的行 {}: {}", idx + 1, line);
+            warnings.push(format!(
+                "⚠️  跳过格式错误的行 {}:{}: {}",
+                path.display(),
+                idx + 1,
+                line
+            ));
             continue;
         }
 
@@ -47,17 +58,84 @@ fn parse_csv_file(path: &Path) -> Result<Vec<G4Record>, Box<dyn std::error::Erro
     Ok(records)
 }
 
+type RecordKey<'a> = (u32, u32, &'a str);
+
+fn record_key(record: &G4Record) -> RecordKey<'_> {
+    (record.start, record.end, record.sequence.as_str())
+}
+
+// 按 (start, end, sequence) 键做多重集合比较，重复记录按出现次数计数；
+// 返回两侧多出的记录（按文件顺序），单条插入或缺失只计一处差异
+fn unmatched_records<'a>(
+    mmap_records: &'a [G4Record],
+    stream_records: &'a [G4Record],
+) -> (Vec<&'a G4Record>, Vec<&'a G4Record>) {
+    let mut surplus: HashMap<RecordKey, isize> = HashMap::new();
+    for record in mmap_records {
+        *surplus.entry(record_key(record)).or_insert(0) += 1;
+    }
+    for record in stream_records {
+        *surplus.entry(record_key(record)).or_insert(0) -= 1;
+    }
+
+    let mut only_mmap = Vec::new();
+    for record in mmap_records {
+        if let Some(count) = surplus.get_mut(&record_key(record))
+            && *count > 0
+        {
+            *count -= 1;
+            only_mmap.push(record);
+        }
+    }
+    let mut only_stream = Vec::new();
+    for record in stream_records {
+        if let Some(count) = surplus.get_mut(&record_key(record))
+            && *count < 0
+        {
+            *count += 1;
+            only_stream.push(record);
+        }
+    }
+    (only_mmap, only_stream)
+}
+
 fn compare_records(mmap_records: &[G4Record], stream_records: &[G4Record]) -> (usize, Vec<String>) {
     let mut mismatches = 0;
     let mut details = Vec::new();
 
+    // 数量不一致时逐条位置比较没有意义，只报告按键匹配不上的记录
     if mmap_records.len() != stream_records.len() {
         details.push(format!(
             "  ⚠️  记录数量不一致: mmap={}, stream={}",
             mmap_records.len(),
             stream_records.len()
         ));
+        let (only_mmap, only_stream) = unmatched_records(mmap_records, stream_records);
+        details.push(format!(
+            "      按 (start, end, sequence) 匹配: 仅 mmap={}, 仅 stream={}",
+            only_mmap.len(),
+            only_stream.len()
+        ));
         mismatches += 1;
+
+        let unmatched = only_mmap
+            .iter()
+            .map(|record| ("mmap", record))
+            .chain(only_stream.iter().map(|record| ("stream", record)));
+        for (side, record) in unmatched {
+            mismatches += 1;
+            if mismatches <= 10 {
+                details.push(format!(
+                    "  ⚠️  仅在 {} 中: {}..{} {}",
+                    side, record.start, record.end, record.sequence
+                ));
+            }
+        }
+
+        if mismatches > 10 {
+            details.push(format!("  ... (省略其余 {} 处差异)", mismatches - 10));
+        }
+        return (mismatches, details);
     }
 
     let min_len = mmap_records.len().min(stream_records.len());
@@ -111,6 +189,21 @@ fn compare_records(mmap_records: &[G4Record], stream_records: &[G4Record]) -> (u
     (mismatches, details)
 }
 
+type FileComparison = Result<(usize, usize, Vec<String>), String>;
+
+fn compare_file(
+    mmap_path: &Path,
+    stream_path: &Path,
+    warnings: &mut Vec<String>,
+) -> FileComparison {
+    let mmap_records =
+        parse_csv_file(mmap_path, warnings).map_err(|e| format!("读取 mmap 文件失败: {}", e))?;
+    let stream_records = parse_csv_file(stream_path, warnings)
+        .map_err(|e| format!("读取 stream 文件失败: {}", e))?;
+    let (mismatches, details) = compare_records(&mmap_records, &stream_records);
+    Ok((mmap_records.len(), mismatches, details))
+}
+
 fn main() {
     let args: Vec<String> = std::env::args().collect();
 
@@ -198,41 +291,46 @@ fn main() {
     let mut total_mismatches = 0;
     let mut file_results = Vec::new();
 
-    for file_name in &common_files {
-        let mmap_path = mmap_dir.join(file_name);
-        let stream_path = stream_dir.join(file_name);
+    // 各文件互不依赖，可并行解析和比较；结果与警告按文件名顺序输出
+    let comparisons: Vec<(Vec<String>, FileComparison)> = common_files
+        .par_iter()
+        .map(|file_name| {
+            let mut warnings = Vec::new();
+            let comparison = compare_file(
+                &mmap_dir.join(file_name),
+                &stream_dir.join(file_name),
+                &mut warnings,
+            );
+            (warnings, comparison)
+        })
+        .collect();
 
+    for (file_name, (warnings, comparison)) in common_files.iter().zip(comparisons) {
         print!("🔍 比较 {}... ", file_name);
 
-        let mmap_records = match parse_csv_file(&mmap_path) {
-            Ok(r) => r,
-            Err(e) => {
+        match comparison {
+            Err(message) => {
                 println!("❌");
-                eprintln!("  读取 mmap 文件失败: {}", e);
+                eprintln!("  {}", message);
                 total_mismatches += 1;
-                continue;
             }
-        };
-
-        let stream_records = match parse_csv_file(&stream_path) {
-            Ok(r) => r,
-            Err(e) => {
-                println!("❌");
-                eprintln!("  读取 stream 文件失败: {}", e);
+            Ok((record_count, 0, details)) => {
+                println!("✅ ({} 条记录)", record_count);
+                file_results.push((file_name.clone(), true, record_count, details));
+            }
+            Ok((_, mismatches, details)) => {
+                println!("❌ ({} 处差异)", mismatches);
+                file_results.push((file_name.clone(), false, mismatches, details));
                 total_mismatches += 1;
-                continue;
             }
-        };
-
-        let (mismatches, details) = compare_records(&mmap_records, &stream_records);
+        }
 
-        if mismatches == 0 {
-            println!("✅ ({} 条记录)", mmap_records.len());
-            file_results.push((file_name.clone(), true, mmap_records.len(), details));
-        } else {
-            println!("❌ ({} 处差异)", mismatches);
-            file_results.push((file_name.clone(), false, mismatches, details));
-            total_mismatches += 1;
+        if !warnings.is_empty() {
+            // 先刷新 stdout，保证警告出现在对应文件的结果行之后
+            io::stdout().flush().ok();
+            for warning in &warnings {
+                eprintln!("  {}", warning);
+            }
         }
     }
 
@@ -1,5 +1,3 @@
-use std::collections::BTreeMap;
-
 use crate::qgrs::data::SequenceTopology;
 use crate::qgrs::search::G4;
 
@@ -102,14 +100,16 @@ fn consolidate_circular(raw_g4s: Vec<G4>, sequence_len: usize) -> (Vec<G4>, Vec<
         }
     }
 
-    let mut members_by_root: BTreeMap<usize, Vec<usize>> = BTreeMap::new();
+    // DSU roots are dense indices into `raw_g4s`; walking the buckets in index
+    // order visits families by ascending root.
+    let mut members_by_root: Vec<Vec<usize>> = vec![Vec::new(); raw_g4s.len()];
     for index in 0..raw_g4s.len() {
         let root = dsu.find(index);
-        members_by_root.entry(root).or_default().push(index);
+        members_by_root[root].push(index);
     }
 
-    let mut grouped: Vec<(usize, usize, G4)> = Vec::with_capacity(members_by_root.len());
-    for members in members_by_root.values() {
+    let mut grouped: Vec<(usize, usize, G4)> = Vec::new();
+    for members in members_by_root.iter().filter(|members| !members.is_empty()) {
         let mut best_index = members[0];
         for &candidate_index in members.iter().skip(1) {
             if is_better_candidate(&raw_g4s[best_index], &raw_g4s[candidate_index]) {
@@ -4,6 +4,7 @@ use std::sync::Arc;
 
 use arrow_array::{ArrayRef, Int32Array, RecordBatch, StringArray, UInt64Array};
 use arrow_schema::{DataType, Field, Schema};
+use memchr::{memchr_iter, memchr3};
 use parquet::arrow::arrow_writer::ArrowWriter;
 use parquet::errors::ParquetError;
 
@@ -50,18 +51,19 @@ fn escape_csv_field(value: &str) -> String {
     if value.is_empty() {
         return String::new();
     }
-    let needs_quotes = value.contains([',', '"', '\n']);
-    if !needs_quotes {
+    let bytes = value.as_bytes();
+    if memchr3(b',', b'"', b'\n', bytes).is_none() {
         return value.to_string();
     }
-    let mut escaped = String::from('"');
-    for ch in value.chars() {
-        if ch == '"' {
-            escaped.push_str("\"\"");
-        } else {
-            escaped.push(ch);
-        }
+    let mut escaped = String::with_capacity(value.len() + 2);
+    escaped.push('"');
+    let mut copied = 0;
+    for quote in memchr_iter(b'"', bytes) {
+        escaped.push_str(&value[copied..=quote]);
+        escaped.push('"');
+        copied = quote + 1;
     }
+    escaped.push_str(&value[copied..]);
     escaped.push('"');
     escaped
 }
@@ -178,7 +180,7 @@ fn write_parquet_from_results<W: Write + Send + 'static>(
     let y2s: Vec<i32> = g4s.iter().map(|g| g.y2).collect();
     let y3s: Vec<i32> = g4s.iter().map(|g| g.y3).collect();
     let scores: Vec<i32> = g4s.iter().map(|g| g.score).collect();
-    let sequences: Vec<String> = g4s.iter().map(|g| g.sequence().to_string()).collect();
+    let sequences: Vec<&str> = g4s.iter().map(|g| g.sequence()).collect();
 
     let columns: Vec<ArrayRef> = vec![
         Arc::new(UInt64Array::from(starts)),
@@ -3,6 +3,7 @@ use std::io::{self, BufRead, Read};
 use std::path::Path;
 use std::sync::Arc;
 
+use memchr::memchr2;
 use memmap2::MmapOptions;
 
 use crate::qgrs::data::{ChromSequence, InputMode};
@@ -25,23 +26,18 @@ fn parse_sequences_from_reader(reader: &mut dyn BufRead) -> io::Result<Vec<Chrom
     let mut sequences = Vec::new();
     let mut current_name: Option<String> = None;
     let mut sequence: Vec<u8> = Vec::new();
-    let mut line = String::new();
+    let mut line: Vec<u8> = Vec::new();
     loop {
         line.clear();
-        if reader.read_line(&mut line)? == 0 {
+        if reader.read_until(b'\n', &mut line)? == 0 {
             break;
         }
-        if line.starts_with('>') {
+        if line.first() == Some(&b'>') {
             finalize_sequence(&mut current_name, &mut sequence, &mut sequences);
-            current_name = Some(parse_chrom_name(&line, sequences.len() + 1));
+            current_name = Some(parse_chrom_name_bytes(&line, sequences.len() + 1));
             continue;
         }
-        for byte in line.bytes() {
-            if byte.is_ascii_whitespace() {
-                continue;
-            }
-            sequence.push(byte.to_ascii_lowercase());
-        }
+        append_sequence_line(&mut sequence, trim_line_ending(&line));
     }
     finalize_sequence(&mut current_name, &mut sequence, &mut sequences);
     if !sequence.is_empty() {
@@ -69,34 +65,20 @@ fn parse_sequences_from_bytes(bytes: &[u8]) -> Vec<ChromSequence> {
     let mut sequences = Vec::new();
     let mut sequence = Vec::with_capacity(bytes.len());
     let mut current_name: Option<String> = None;
-    let mut at_line_start = true;
-    let mut i = 0;
-    while i < bytes.len() {
-        let byte = bytes[i];
-        if byte == b'\n' || byte == b'\r' {
-            at_line_start = true;
-            i += 1;
+    let mut pos = 0;
+    while pos < bytes.len() {
+        let line_end = memchr2(b'\n', b'\r', &bytes[pos..]).map_or(bytes.len(), |i| pos + i);
+        let line = &bytes[pos..line_end];
+        pos = line_end + 1;
+        if line.is_empty() {
             continue;
         }
-        if at_line_start && byte == b'>' {
+        if line[0] == b'>' {
             finalize_sequence(&mut current_name, &mut sequence, &mut sequences);
-            i += 1;
-            let header_start = i;
-            while i < bytes.len() && bytes[i] != b'\n' && bytes[i] != b'\r' {
-                i += 1;
-            }
-            let header = &bytes[header_start..i];
-            current_name = Some(parse_chrom_name_bytes(header, sequences.len() + 1));
-            at_line_start = true;
-            continue;
-        }
-        at_line_start = false;
-        if byte.is_ascii_whitespace() {
-            i += 1;
+            current_name = Some(parse_chrom_name_bytes(&line[1..], sequences.len() + 1));
             continue;
         }
-        sequence.push(byte.to_ascii_lowercase());
-        i += 1;
+        append_sequence_line(&mut sequence, line);
     }
     finalize_sequence(&mut current_name, &mut sequence, &mut sequences);
     if !sequence.is_empty() {
@@ -110,6 +92,27 @@ fn parse_sequences_from_bytes(bytes: &[u8]) -> Vec<ChromSequence> {
     sequences
 }
 
+fn trim_line_ending(line: &[u8]) -> &[u8] {
+    let line = line.strip_suffix(b"\n").unwrap_or(line);
+    line.strip_suffix(b"\r").unwrap_or(line)
+}
+
+fn append_sequence_line(sequence: &mut Vec<u8>, line: &[u8]) {
+    if line.iter().any(u8::is_ascii_whitespace) {
+        sequence.extend(
+            line.iter()
+                .filter(|byte| !byte.is_ascii_whitespace())
+                .map(u8::to_ascii_lowercase),
+        );
+        return;
+    }
+    // Sequence lines rarely contain whitespace; copy them wholesale and
+    // lowercase the appended tail in place.
+    let start = sequence.len();
+    sequence.extend_from_slice(line);
+    sequence[start..].make_ascii_lowercase();
+}
+
 fn finalize_sequence(
     current_name: &mut Option<String>,
     sequence: &mut Vec<u8>,
@@ -417,8 +417,10 @@ pub(crate) fn find_raw_on_window_bytes(
     if max_tetrads_allowed >= min_tetrads {
         for (run_start_rel, run_len) in BaseRunScanner::new(window, min_tetrads, target_base) {
             let run_start = window_bounds.base_offset + run_start_rel;
+            // Runs are yielded in ascending start order, so the first run past
+            // the primary section means no later run can seed this window.
             if run_start >= window_bounds.primary_end {
-                continue;
+                break;
             }
             let max_tetrads_for_run = run_len.min(max_tetrads_allowed);
             let mut tetrads = min_tetrads;
@@ -115,6 +115,42 @@ fn load_sequences_mmap_mode_splits_chromosomes() {
     fs::remove_file(&path).unwrap();
 }
 
+#[test]
+fn load_sequences_mmap_mode_skips_inline_whitespace() {
+    let path = env::temp_dir().join("qgrs_mmap_whitespace_input.fa");
+    fs::write(&path, b">chr1\nGG GG\t\n\nac\r\n>chr2\nTT\rtt").unwrap();
+    let seqs = load_sequences_from_path(&path, InputMode::Mmap).unwrap();
+    assert_eq!(seqs.len(), 2);
+    assert_eq!(seqs[0].name(), "chr1");
+    assert_eq!(seqs[0].as_uppercase_string(), "GGGGAC");
+    assert_eq!(seqs[1].name(), "chr2");
+    assert_eq!(seqs[1].as_uppercase_string(), "TTTT");
+    fs::remove_file(&path).unwrap();
+}
+
+#[test]
+fn load_sequences_stream_mode_matches_mmap_on_crlf_whitespace_and_non_utf8() {
+    let path = env::temp_dir().join("qgrs_stream_bytes_input.fa");
+    fs::write(
+        &path,
+        b">chr1\r\nGG GG\t\r\nac\r\n>chr\xff2\r\nTT\xfftt\r\n",
+    )
+    .unwrap();
+    let stream = load_sequences_from_path(&path, InputMode::Stream).unwrap();
+    let mmap = load_sequences_from_path(&path, InputMode::Mmap).unwrap();
+    assert_eq!(stream.len(), 2);
+    assert_eq!(stream[0].name(), "chr1");
+    assert_eq!(stream[0].sequence().as_slice(), b"ggggac");
+    assert_eq!(stream[1].name(), "chromosome_2");
+    assert_eq!(stream[1].sequence().as_slice(), b"tt\xfftt");
+    assert_eq!(stream.len(), mmap.len());
+    for (from_stream, from_mmap) in stream.iter().zip(&mmap) {
+        assert_eq!(from_stream.name(), from_mmap.name());
+        assert_eq!(from_stream.sequence(), from_mmap.sequence());
+    }
+    fs::remove_file(&path).unwrap();
+}
+
 #[test]
 fn load_sequences_stream_mode_reads_gzip_fasta() {
     let path = env::temp_dir().join("qgrs_stream_input.magic");